@@ -18,9 +18,7 @@ export const createWaterPattern = (ctx: CanvasRenderingContext2D, scenario: Mari
     tileCanvas.height = tile.height;
     const tileCtx = tileCanvas.getContext("2d");
     if (!tileCtx) return null;
-    const image = new ImageData(tile.width, tile.height);
-    image.data.set(tile.pixels);
-    tileCtx.putImageData(image, 0, 0);
+    tileCtx.putImageData(new ImageData(tile.pixels, tile.width, tile.height), 0, 0);
     return ctx.createPattern(tileCanvas, "repeat");
 };
 
@@ -135,8 +135,10 @@ export const categoryLabels: Record<ScenarioCategory, string> = {
 
 export const categoryOrder: ScenarioCategory[] = ["training", "stress-test", "demo"];
 
+const presetsById: ReadonlyMap<string, ScenarioPreset> = new Map(scenarioPresets.map((p) => [p.id, p]));
+
 export function getPresetById(id: string): ScenarioPreset | undefined {
-    return scenarioPresets.find((p) => p.id === id);
+    return presetsById.get(id);
 }
 
 export async function readScenarioFile(file: File): Promise<MaritimeScenario> {
@@ -167,13 +169,19 @@ function getRawPreview(raw: string | null): string | null {
     return typeof raw === "string" ? raw.slice(0, 240) : null;
 }
 
+// Parsed result of the last storage payload; reused while the raw string is unchanged.
+let customScenarioCache: { raw: string; scenarios: SavedCustomScenario[] } | null = null;
+
 export function loadCustomScenarios(): SavedCustomScenario[] {
     let raw: string | null = null;
     try {
         raw = localStorage.getItem(CUSTOM_STORAGE_KEY);
         if (!raw) return [];
+        if (customScenarioCache?.raw === raw) return customScenarioCache.scenarios;
         const parsed = JSON.parse(raw);
-        return Array.isArray(parsed) ? parsed : [];
+        const scenarios: SavedCustomScenario[] = Array.isArray(parsed) ? parsed : [];
+        customScenarioCache = {raw, scenarios};
+        return scenarios;
     } catch (err) {
         logError(err, {
             origin: "scenarios.custom.load",
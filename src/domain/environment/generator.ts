@@ -76,7 +76,7 @@ export type GeneratorParams = {
 export type WaterTileData = {
     width: number;
     height: number;
-    pixels: Uint8ClampedArray;
+    pixels: Uint8ClampedArray<ArrayBuffer>;
 };
 
 export const defaultWaterSettings: WaterSettings = {
@@ -88,6 +88,15 @@ export const defaultWaterSettings: WaterSettings = {
     textureStrength: 0.65,
 };
 
+const conditionDescriptions = [
+    "Calm swell with light breeze",
+    "Gentle chop; steady breeze",
+    "Moderate seas with scattered whitecaps",
+    "Rising swell and gusty wind",
+    "Low visibility haze over the water",
+    "Dense fog pockets and cool air",
+];
+
 export const anomalyTypeLabels: Record<AnomalyType, string> = {
     "person-in-water": "Person in Water",
     "lifeboat": "Lifeboat",
@@ -209,14 +218,7 @@ export function generateSector(params: GeneratorParams): MaritimeScenario {
         windDirectionDeg: Math.round(lerp(0, 359, windDirectionNoise)),
         visibilityKm: Math.round(lerp(4, 30, visibilityNoise)),
         surfaceTempC: Math.round(lerp(12, 28, rng())),
-        description: pick([
-            "Calm swell with light breeze",
-            "Gentle chop; steady breeze",
-            "Moderate seas with scattered whitecaps",
-            "Rising swell and gusty wind",
-            "Low visibility haze over the water",
-            "Dense fog pockets and cool air",
-        ], rng),
+        description: pick(conditionDescriptions, rng),
     };
 
     const seaStateFactor = clamp(seaState / 9, 0, 1);
@@ -268,7 +270,33 @@ export function generateSector(params: GeneratorParams): MaritimeScenario {
     };
 }
 
+const MAX_WATER_TILE_CACHE_ENTRIES = 8;
+const waterTileCache = new Map<string, WaterTileData>();
+
+const waterTileCacheKey = (settings: WaterSettings, seed: string) => JSON.stringify([
+    seed,
+    settings.tileSize,
+    settings.noiseScale,
+    settings.detailScale,
+    settings.baseColor,
+    settings.highlightColor,
+    settings.textureStrength,
+]);
+
 export function generateWaterTileData(settings: WaterSettings, seed: string): WaterTileData {
+    const key = waterTileCacheKey(settings, seed);
+    const cached = waterTileCache.get(key);
+    if (cached) return cached;
+    const tile = renderWaterTileData(settings, seed);
+    waterTileCache.set(key, tile);
+    if (waterTileCache.size > MAX_WATER_TILE_CACHE_ENTRIES) {
+        const oldest = waterTileCache.keys().next().value;
+        if (oldest !== undefined) waterTileCache.delete(oldest);
+    }
+    return tile;
+}
+
+function renderWaterTileData(settings: WaterSettings, seed: string): WaterTileData {
     const width = settings.tileSize;
     const height = settings.tileSize;
     const pixels = new Uint8ClampedArray(width * height * 4);
@@ -285,20 +313,26 @@ export function generateWaterTileData(settings: WaterSettings, seed: string): Wa
         return lerp(lerp(n00, n10, u), lerp(n01, n11, u), v);
     };
 
+    const {noiseScale, detailScale, textureStrength, baseColor, highlightColor} = settings;
+    const detailNoiseScale = noiseScale * 2.3;
+    const textureFloor = (1 - textureStrength) * 0.45;
+    const [baseR, baseG, baseB] = baseColor;
+    const deltaR = highlightColor[0] - baseR;
+    const deltaG = highlightColor[1] - baseG;
+    const deltaB = highlightColor[2] - baseB;
+
     for (let y = 0; y < height; y++) {
+        let idx = y * width * 4;
         for (let x = 0; x < width; x++) {
-            const primary = tileableNoise(x, y, settings.noiseScale);
-            const detail = tileableNoise(x, y, settings.noiseScale * 2.3) * settings.detailScale;
+            const primary = tileableNoise(x, y, noiseScale);
+            const detail = tileableNoise(x, y, detailNoiseScale) * detailScale;
             const value = clamp(0.5 + primary * 0.4 + detail, 0, 1);
-            const t = Math.pow(value, 1.2) * settings.textureStrength + (1 - settings.textureStrength) * 0.45;
-            const r = Math.round(lerp(settings.baseColor[0], settings.highlightColor[0], t));
-            const g = Math.round(lerp(settings.baseColor[1], settings.highlightColor[1], t));
-            const b = Math.round(lerp(settings.baseColor[2], settings.highlightColor[2], t));
-            const idx = (y * width + x) * 4;
-            pixels[idx] = r;
-            pixels[idx + 1] = g;
-            pixels[idx + 2] = b;
+            const t = Math.pow(value, 1.2) * textureStrength + textureFloor;
+            pixels[idx] = Math.round(baseR + deltaR * t);
+            pixels[idx + 1] = Math.round(baseG + deltaG * t);
+            pixels[idx + 2] = Math.round(baseB + deltaB * t);
             pixels[idx + 3] = 255;
+            idx += 4;
         }
     }
 
@@ -13,20 +13,24 @@ import {aggregateDebriefs, generateInsights} from "../utils/debriefAnalysis";
 import type {ManagementInsight} from "../utils/debriefAnalysis";
 import {buildDashboardSummaryMetrics} from "../utils/dashboardMetrics";
 
+const logDebug = (...args: unknown[]) => {
+    if (import.meta.env.DEV) console.log("[ManagementPage]", ...args);
+};
+
 export default function ManagementPage() {
     const navigate = useNavigate();
     const [error, setError] = useState<string | null>(null);
 
     useEffect(() => {
-        console.log("[ManagementPage] Mounted");
-        return () => console.log("[ManagementPage] Unmounted");
+        logDebug("Mounted");
+        return () => logDebug("Unmounted");
     }, []);
 
     const [debriefs, setDebriefs] = useState<StoredDebrief[]>(() => {
         try {
-            console.log("[ManagementPage] Loading debriefs...");
+            logDebug("Loading debriefs...");
             const loaded = loadAllDebriefs();
-            console.log("[ManagementPage] Loaded", loaded.length, "debriefs");
+            logDebug("Loaded", loaded.length, "debriefs");
             return loaded;
         } catch (e) {
             const errorMsg = `Failed to load debriefs on mount: ${e instanceof Error ? e.message : String(e)}`;